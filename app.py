@@ -1,37 +1,61 @@
-from flask import Flask, request, jsonify
-from part1_open_course import CompleteAssignmentScraper
-
-app = Flask(_name_)
-
-# Store credentials in memory (for demo only)
-user_credentials = {}
-
-@app.route('/save_credentials', methods=['POST'])
-def save_credentials():
-    data = request.json
-    if not data:
-        return jsonify({'error': 'No JSON data received'}), 400
-    username = data.get('username')
-    password = data.get('password')
-    if not username or not password:
-        return jsonify({'error': 'Missing fields'}), 400
-    user_credentials['username'] = username
-    user_credentials['password'] = password
-    return jsonify({'message': 'Credentials saved successfully'})
-
-@app.route('/scrape', methods=['POST'])
-def scrape():
-    data = request.json
-    if not data:
-        return jsonify({'error': 'No JSON data received'}), 400
-    url = data.get('url')
-    username = data.get('username') or user_credentials.get('username')
-    password = data.get('password') or user_credentials.get('password')
-    if not url or not username or not password:
-        return jsonify({'error': 'Missing fields'}), 400
-    scraper = CompleteAssignmentScraper()
-    assignments = scraper.scrape_assignments(url, username, password)
-    return jsonify(assignments)
-
-if _name_ == '_main_':
-    app.run(debug=True)
\ No newline at end of file
+import asyncio
+import uuid
+
+from quart import Quart, request, jsonify
+from iby_agent import CompleteAssignmentScraper
+
+app = Quart(__name__)
+
+# Store credentials in memory (for demo only). Handlers all run on the
+# event loop, so plain dicts need no locking here.
+user_credentials = {}
+
+# Scrapes take minutes, so run them as background tasks (Selenium work is
+# pushed to a thread via asyncio.to_thread) and let clients poll.
+scrape_jobs = {}
+
+@app.route('/save_credentials', methods=['POST'])
+async def save_credentials():
+    data = await request.get_json()
+    if not data:
+        return jsonify({'error': 'No JSON data received'}), 400
+    username = data.get('username')
+    password = data.get('password')
+    if not username or not password:
+        return jsonify({'error': 'Missing fields'}), 400
+    user_credentials['username'] = username
+    user_credentials['password'] = password
+    return jsonify({'message': 'Credentials saved successfully'})
+
+@app.route('/scrape', methods=['POST'])
+async def scrape():
+    data = await request.get_json()
+    if not data:
+        return jsonify({'error': 'No JSON data received'}), 400
+    url = data.get('url')
+    username = data.get('username') or user_credentials.get('username')
+    password = data.get('password') or user_credentials.get('password')
+    if not url or not username or not password:
+        return jsonify({'error': 'Missing fields'}), 400
+    scraper = CompleteAssignmentScraper(interactive=False)
+    job_id = str(uuid.uuid4())
+    scrape_jobs[job_id] = asyncio.create_task(
+        asyncio.to_thread(scraper.scrape_assignments, url, username, password)
+    )
+    return jsonify({'job_id': job_id}), 202
+
+@app.route('/scrape_status/<job_id>', methods=['GET'])
+async def scrape_status(job_id):
+    task = scrape_jobs.get(job_id)
+    if task is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    if not task.done():
+        return jsonify({'status': 'running'})
+    error = task.exception()
+    if error:
+        return jsonify({'status': 'failed', 'error': str(error)}), 500
+    return jsonify({'status': 'done', 'assignments': task.result()})
+
+if __name__ == '__main__':
+    # For production serve with: hypercorn app:app
+    app.run(debug=False)
@@ -5,17 +5,21 @@ All functionality in one file for easy setup.
 """
 
 import re
-import time
+import functools
 import getpass
 import json
 import os
 import sqlite3
 import smtplib
+import atexit
+import queue
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 # Selenium imports
 from selenium import webdriver
@@ -27,6 +31,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# lxml parses the page snapshot in-process, so element text and parent
+# walks don't each pay a WebDriver round trip
+import lxml.html
+
 # Optional imports (will fallback if not available)
 try:
     import dateparser
@@ -41,18 +49,171 @@ except ImportError:
     print("⚠️ plyer not installed. Desktop notifications disabled.")
 
 
+# Compiled once at import: these run inside the per-element scraping loops
+_URL_RE = re.compile(r'https?://')
+_WS_RE = re.compile(r'\s+')
+
+# Format: "Tuesday, 19 August 2025, 12:00 AM"
+_DUE_DATE_FMT = "%A, %d %B %Y, %I:%M %p"
+
+# Shared HTTP session: pooled connections let repeated HTTPS calls (e.g.
+# Telegram notifications) reuse the TCP+TLS handshake instead of paying
+# it on every request
+HTTP = requests.Session()
+HTTP.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+HTTP.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+
+# Tags the browser renders as line breaks; inline markup (e.g.
+# <strong>Due:</strong> inside a date line) must not split a line
+_BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl',
+    'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'table', 'td', 'th', 'tr', 'ul'
+])
+
+# Subtrees that rendered text never includes
+_SKIP_TAGS = frozenset(['script', 'style', 'noscript', 'template'])
+
+
+def _element_text(el) -> str:
+    """Approximate Selenium's rendered .text for an lxml element: newlines
+    only at block-level boundaries, script/style content excluded"""
+    lines = []
+    parts = []
+
+    def flush():
+        line = _WS_RE.sub(' ', ''.join(parts)).strip()
+        parts.clear()
+        if line:
+            lines.append(line)
+
+    def walk(node):
+        if not isinstance(node.tag, str):
+            return  # comments / processing instructions
+        tag = node.tag.lower()
+        if tag in _SKIP_TAGS:
+            return
+        block = tag in _BLOCK_TAGS
+        if block:
+            flush()
+        if node.text:
+            parts.append(node.text)
+        for child in node.iterchildren():
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            flush()
+
+    walk(el)
+    flush()
+    return '\n'.join(lines)
+
+
+# Driver pool: booting Chrome plus the ChromeDriverManager update check costs
+# several seconds per scrape, so reuse a small pool of drivers instead of
+# spawning and quitting one per call.
+DRIVER_POOL_SIZE = 4
+
+_driver_pool = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+_driver_count = 0
+_driver_lock = threading.Lock()
+
+# Resolve the chromedriver binary at import: install() does a network
+# update check plus disk I/O, so pay for it once per process instead of
+# on every driver creation
+try:
+    _chromedriver_path = ChromeDriverManager().install()
+except Exception as e:
+    _chromedriver_path = None
+    print(f"⚠️ Could not resolve chromedriver at import: {e}")
+
+
+def _get_chromedriver_path() -> str:
+    """Return the memoized chromedriver path, retrying if import-time
+    resolution failed (e.g. no network yet)"""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+def _create_driver():
+    options = Options()
+    options.add_argument("--start-maximized")
+    return webdriver.Chrome(service=ChromeService(_get_chromedriver_path()), options=options)
+
+
+def acquire_driver():
+    """Check a Chrome driver out of the pool, creating one if under the cap"""
+    global _driver_count
+    try:
+        return _driver_pool.get_nowait()
+    except queue.Empty:
+        pass
+    with _driver_lock:
+        if _driver_count < DRIVER_POOL_SIZE:
+            _driver_count += 1
+            try:
+                return _create_driver()
+            except Exception:
+                # Roll back the slot so a transient startup failure does not
+                # permanently shrink the pool
+                _driver_count -= 1
+                raise
+    return _driver_pool.get()
+
+
+def release_driver(driver):
+    """Reset a driver and return it to the pool for the next scrape"""
+    global _driver_count
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+        _driver_pool.put_nowait(driver)
+    except Exception:
+        # Driver is broken (or the pool is full) - drop it instead
+        with _driver_lock:
+            _driver_count -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _quit_pooled_drivers():
+    while True:
+        try:
+            driver = _driver_pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
 class AssignmentStorage:
     """Handles storing and retrieving assignment data"""
     
     def __init__(self, db_path: str = "assignments.db"):
         self.db_path = db_path
+        # One long-lived connection: opening a fresh connection per call pays
+        # journal setup and fsync costs on every tiny write. WAL mode lets
+        # readers run alongside the writer; the lock serializes our threads.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         self.init_database()
-    
+
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cursor = self.conn.cursor()
+
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS assignments (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -65,9 +226,18 @@ class AssignmentStorage:
                 UNIQUE(course_url, assignment_name)
             )
         """)
-        
-        conn.commit()
-        conn.close()
+
+        # Partial index so the upcoming-deadlines range query is an index
+        # probe instead of a full table scan (NULL due dates are skipped)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_assignments_due
+            ON assignments(due_date_parsed)
+            WHERE due_date_parsed IS NOT NULL
+        """)
+
+        cursor.execute("ANALYZE")
+
+        self.conn.commit()
         print("✅ Database initialized")
     
     def parse_due_date(self, due_date_raw: str) -> Optional[datetime]:
@@ -84,84 +254,68 @@ class AssignmentStorage:
             if parsed_date:
                 return parsed_date
         
-        # Fallback: manual parsing for common formats
-        try:
-            # Format: "Tuesday, 19 August 2025, 12:00 AM"
-            parsed_date = datetime.strptime(cleaned, "%A, %d %B %Y, %I:%M %p")
-            return parsed_date
-        except:
-            pass
-        
+        # Fallback: manual parsing for the common format
         try:
-            # Format: "Saturday, 30 August 2025, 11:59 PM"  
-            parsed_date = datetime.strptime(cleaned, "%A, %d %B %Y, %I:%M %p")
-            return parsed_date
+            return datetime.strptime(cleaned, _DUE_DATE_FMT)
         except:
             pass
-        
+
         return None
     
     def store_assignments(self, course_url: str, assignments: List[Dict[str, str]]) -> Dict[str, int]:
         """Store assignments in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        stats = {'new': 0, 'updated': 0, 'total': 0}
-        
+        rows = []
         for assignment in assignments:
             title = assignment.get('title', '').replace('Title: ', '')
             due_date_raw = assignment.get('due_date', 'No due date found')
-            due_date_parsed = self.parse_due_date(due_date_raw)
-            
-            # Check if assignment already exists
+            rows.append((course_url, title, due_date_raw, self.parse_due_date(due_date_raw)))
+
+        with self.lock:
+            cursor = self.conn.cursor()
+
+            # One SELECT up front so new/updated counts survive the batch upsert
             cursor.execute("""
-                SELECT id FROM assignments 
-                WHERE course_url = ? AND assignment_name = ?
-            """, (course_url, title))
-            
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing
-                cursor.execute("""
-                    UPDATE assignments 
-                    SET due_date_raw = ?, due_date_parsed = ?, extracted_at = CURRENT_TIMESTAMP
-                    WHERE course_url = ? AND assignment_name = ?
-                """, (due_date_raw, due_date_parsed, course_url, title))
-                stats['updated'] += 1
-            else:
-                # Insert new
-                cursor.execute("""
-                    INSERT INTO assignments 
-                    (course_url, assignment_name, due_date_raw, due_date_parsed)
-                    VALUES (?, ?, ?, ?)
-                """, (course_url, title, due_date_raw, due_date_parsed))
-                stats['new'] += 1
-            
-            stats['total'] += 1
-        
-        conn.commit()
-        conn.close()
-        
-        return stats
+                SELECT assignment_name FROM assignments WHERE course_url = ?
+            """, (course_url,))
+            existing_names = {row[0] for row in cursor.fetchall()}
+
+            # Single transaction, one statement for the whole batch
+            cursor.executemany("""
+                INSERT INTO assignments
+                (course_url, assignment_name, due_date_raw, due_date_parsed)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(course_url, assignment_name) DO UPDATE SET
+                    due_date_raw = excluded.due_date_raw,
+                    due_date_parsed = excluded.due_date_parsed,
+                    extracted_at = CURRENT_TIMESTAMP
+            """, rows)
+
+            self.conn.commit()
+
+        updated = sum(1 for row in rows if row[1] in existing_names)
+        return {
+            'new': len(rows) - updated,
+            'updated': updated,
+            'total': len(rows)
+        }
     
     def get_upcoming_deadlines(self, days_ahead: int = 7) -> List[Dict]:
         """Get assignments with deadlines in next X days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         future_date = datetime.now() + timedelta(days=days_ahead)
-        
-        cursor.execute("""
-            SELECT assignment_name, due_date_parsed, due_date_raw, course_url, notified
-            FROM assignments 
-            WHERE due_date_parsed IS NOT NULL 
-            AND due_date_parsed BETWEEN datetime('now') AND ?
-            ORDER BY due_date_parsed ASC
-        """, (future_date,))
-        
+
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT assignment_name, due_date_parsed, due_date_raw, course_url, notified
+                FROM assignments
+                WHERE due_date_parsed IS NOT NULL
+                AND due_date_parsed BETWEEN datetime('now') AND ?
+                ORDER BY due_date_parsed ASC
+            """, (future_date,))
+            rows = cursor.fetchall()
+
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 'assignment_name': row[0],
                 'due_date_parsed': datetime.fromisoformat(row[1]) if row[1] else None,
@@ -169,37 +323,32 @@ class AssignmentStorage:
                 'course_url': row[3],
                 'notified': bool(row[4])
             })
-        
-        conn.close()
+
         return results
     
     def mark_as_notified(self, course_url: str, assignment_name: str):
         """Mark assignment as notified"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE assignments 
-            SET notified = TRUE 
-            WHERE course_url = ? AND assignment_name = ?
-        """, (course_url, assignment_name))
-        
-        conn.commit()
-        conn.close()
+        with self.lock:
+            self.conn.execute("""
+                UPDATE assignments
+                SET notified = TRUE
+                WHERE course_url = ? AND assignment_name = ?
+            """, (course_url, assignment_name))
+            self.conn.commit()
     
     def get_all_assignments(self) -> List[Dict]:
         """Get all stored assignments"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT assignment_name, due_date_parsed, due_date_raw, course_url, extracted_at, notified
-            FROM assignments 
-            ORDER BY due_date_parsed ASC
-        """)
-        
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT assignment_name, due_date_parsed, due_date_raw, course_url, extracted_at, notified
+                FROM assignments
+                ORDER BY due_date_parsed ASC
+            """)
+            rows = cursor.fetchall()
+
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             results.append({
                 'assignment_name': row[0],
                 'due_date_parsed': datetime.fromisoformat(row[1]) if row[1] else None,
@@ -208,61 +357,74 @@ class AssignmentStorage:
                 'extracted_at': row[4],
                 'notified': bool(row[5])
             })
-        
-        conn.close()
+
         return results
 
 
+def _default_notification_config() -> Dict:
+    return {
+        "email": {
+            "enabled": False,
+            "smtp_server": "smtp.gmail.com",
+            "smtp_port": 587,
+            "sender_email": "",
+            "sender_password": "",
+            "recipient_email": ""
+        },
+        "telegram": {
+            "enabled": False,
+            "bot_token": "",
+            "chat_id": ""
+        },
+        "desktop": {
+            "enabled": True
+        },
+        "notification_settings": {
+            "advance_days": [7, 3, 1],
+            "daily_reminder_hour": 9
+        }
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _load_notification_config(config_file: str, mtime: float) -> Dict:
+    """Parse a config file and merge it over the defaults. Cached per
+    (path, mtime), so an unchanged file is only read and parsed once
+    no matter how many NotificationSystems are created."""
+    default_config = _default_notification_config()
+    try:
+        with open(config_file, 'r') as f:
+            loaded_config = json.load(f)
+        for key in default_config:
+            if key in loaded_config:
+                if isinstance(default_config[key], dict):
+                    default_config[key].update(loaded_config[key])
+                else:
+                    default_config[key] = loaded_config[key]
+    except Exception as e:
+        print(f"Error loading config: {e}")
+
+    return default_config
+
+
 class NotificationSystem:
     """Handles different types of notifications"""
-    
+
     def __init__(self, config_file: str = "notification_config.json"):
         self.config_file = config_file
         self.config = self.load_config()
-    
+        self._smtp = None
+
     def load_config(self) -> Dict:
         """Load notification configuration"""
-        default_config = {
-            "email": {
-                "enabled": False,
-                "smtp_server": "smtp.gmail.com",
-                "smtp_port": 587,
-                "sender_email": "",
-                "sender_password": "",
-                "recipient_email": ""
-            },
-            "telegram": {
-                "enabled": False,
-                "bot_token": "",
-                "chat_id": ""
-            },
-            "desktop": {
-                "enabled": True
-            },
-            "notification_settings": {
-                "advance_days": [7, 3, 1],
-                "daily_reminder_hour": 9
-            }
-        }
-        
         if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    for key in default_config:
-                        if key in loaded_config:
-                            if isinstance(default_config[key], dict):
-                                default_config[key].update(loaded_config[key])
-                            else:
-                                default_config[key] = loaded_config[key]
-                return default_config
-            except Exception as e:
-                print(f"Error loading config: {e}")
-        
+            return _load_notification_config(self.config_file, os.path.getmtime(self.config_file))
+
         # Create default config file
+        default_config = _default_notification_config()
         with open(self.config_file, 'w') as f:
             json.dump(default_config, f, indent=2)
-        
+
         print(f"✅ Created config file: {self.config_file}")
         return default_config
     
@@ -282,31 +444,68 @@ class NotificationSystem:
         except Exception as e:
             print(f"❌ Desktop notification failed: {e}")
     
+    def _connect_smtp(self):
+        server = smtplib.SMTP(self.config["email"]["smtp_server"], self.config["email"]["smtp_port"])
+        server.starttls()
+        server.login(self.config["email"]["sender_email"], self.config["email"]["sender_password"])
+        return server
+
     def send_email(self, subject: str, body: str):
         """Send email notification"""
         if not self.config["email"]["enabled"]:
             return
-        
+
         try:
             msg = MIMEMultipart()
             msg['From'] = self.config["email"]["sender_email"]
             msg['To'] = self.config["email"]["recipient_email"]
             msg['Subject'] = subject
-            
+
             msg.attach(MIMEText(body, 'plain'))
-            
-            server = smtplib.SMTP(self.config["email"]["smtp_server"], self.config["email"]["smtp_port"])
-            server.starttls()
-            server.login(self.config["email"]["sender_email"], self.config["email"]["sender_password"])
-            
             text = msg.as_string()
-            server.sendmail(self.config["email"]["sender_email"], self.config["email"]["recipient_email"], text)
-            server.quit()
-            
+
+            # Reuse one SMTP connection so a batch of deadline emails pays
+            # the STARTTLS + login handshake once, not per message
+            if self._smtp is None:
+                self._smtp = self._connect_smtp()
+
+            try:
+                self._smtp.sendmail(self.config["email"]["sender_email"], self.config["email"]["recipient_email"], text)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                # Server dropped the idle connection - reconnect once
+                self._smtp = self._connect_smtp()
+                self._smtp.sendmail(self.config["email"]["sender_email"], self.config["email"]["recipient_email"], text)
+
             print(f"✅ Email sent: {subject}")
         except Exception as e:
             print(f"❌ Email failed: {e}")
+
+    def close(self):
+        """Close the persistent SMTP connection (if any)"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
     
+    def send_telegram_notification(self, message: str):
+        """Send Telegram notification"""
+        if not self.config["telegram"]["enabled"]:
+            return
+
+        try:
+            url = f"https://api.telegram.org/bot{self.config['telegram']['bot_token']}/sendMessage"
+            response = HTTP.post(
+                url,
+                json={'chat_id': self.config['telegram']['chat_id'], 'text': message},
+                timeout=10
+            )
+            response.raise_for_status()
+            print("✅ Telegram notification sent")
+        except Exception as e:
+            print(f"❌ Telegram notification failed: {e}")
+
     def notify_assignment_deadline(self, assignment: Dict, days_until: int):
         """Send notification for assignment deadline"""
         name = assignment['assignment_name']
@@ -333,29 +532,37 @@ class NotificationSystem:
         subject = f"📚 {title}: {name}"
         self.send_email(subject, message)
 
+        self.send_telegram_notification(message)
+
 
 class AssignmentClassifier:
     """Simple AI classifier for assignments"""
-    
+
+    # Indicator vocabularies as frozensets: scoring is one hashed set
+    # intersection per text instead of a substring scan per indicator
+    ASSIGNMENT_INDICATORS = frozenset([
+        'assignment', 'homework', 'project', 'essay', 'lab',
+        'programming', 'coding', 'research', 'report', 'analysis'
+    ])
+
+    NON_ASSIGNMENT_INDICATORS = frozenset([
+        'syllabus', 'lecture', 'quiz', 'exam', 'announcement',
+        'discussion', 'forum', 'schedule', 'calendar', 'policy',
+        'introduction', 'overview', 'welcome', 'resources'
+    ])
+
+    # Compiled alternations: one linear regex scan per text instead of a
+    # tokenize-and-hash pass, and \b still matches words wrapped in
+    # punctuation that whitespace tokenization would miss
+    _ASSIGNMENT_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(ASSIGNMENT_INDICATORS))) + r')\b')
+    _NON_ASSIGNMENT_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(NON_ASSIGNMENT_INDICATORS))) + r')\b')
+
     def classify_text(self, text: str) -> Dict:
         """Classify text as assignment or not using heuristics"""
         text_lower = text.lower()
-        
-        # Assignment indicators
-        assignment_indicators = [
-            'assignment', 'homework', 'project', 'essay', 'lab', 
-            'programming', 'coding', 'research', 'report', 'analysis'
-        ]
-        
-        # Non-assignment indicators
-        non_assignment_indicators = [
-            'syllabus', 'lecture', 'quiz', 'exam', 'announcement', 
-            'discussion', 'forum', 'schedule', 'calendar', 'policy',
-            'introduction', 'overview', 'welcome', 'resources'
-        ]
-        
-        assignment_score = sum(1 for indicator in assignment_indicators if indicator in text_lower)
-        non_assignment_score = sum(1 for indicator in non_assignment_indicators if indicator in text_lower)
+
+        assignment_score = len(self._ASSIGNMENT_RE.findall(text_lower))
+        non_assignment_score = len(self._NON_ASSIGNMENT_RE.findall(text_lower))
         
         is_assignment = assignment_score > non_assignment_score
         confidence = max(assignment_score, non_assignment_score) / (assignment_score + non_assignment_score + 1)
@@ -370,15 +577,18 @@ class AssignmentClassifier:
 class CompleteAssignmentScraper:
     """Complete assignment scraper with all functionality"""
     
-    def __init__(self):
+    def __init__(self, interactive: bool = False):
         print("🤖 Initializing Assignment Scraper Agent...")
+        # Only prompt on the console when run interactively; an input() call
+        # from a web worker would block that request forever
+        self.interactive = interactive
         self.storage = AssignmentStorage()
         self.notifier = NotificationSystem()
         self.classifier = AssignmentClassifier()
         print("✅ Agent initialized successfully!")
     
     def is_valid_url(self, url: str) -> bool:
-        return bool(re.match(r'https?://', url))
+        return bool(_URL_RE.match(url))
     
     def try_fill(self, driver, selectors, value) -> bool:
         """Try to fill form fields with given value"""
@@ -400,16 +610,16 @@ class CompleteAssignmentScraper:
     def scrape_assignments(self, url: str, username: str = None, password: str = None) -> list:
         """Scrape assignments from LMS"""
         print("🌐 Starting browser...")
-        options = Options()
-        options.add_argument("--start-maximized")
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        driver = acquire_driver()
         
         assignments = []
         
         try:
             print("📱 Opening LMS URL...")
             driver.get(url)
-            time.sleep(3)
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
             
             # Login if credentials provided
             if username and password:
@@ -426,6 +636,7 @@ class CompleteAssignmentScraper:
                 filled_pass = self.try_fill(driver, password_selectors, password)
                 
                 if filled_user and filled_pass:
+                    pre_login_url = driver.current_url
                     try:
                         pw_elem = driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
                         pw_elem.send_keys(Keys.RETURN)
@@ -436,7 +647,10 @@ class CompleteAssignmentScraper:
                         except Exception:
                             pass
                     print("⏳ Waiting for login...")
-                    time.sleep(5)
+                    try:
+                        WebDriverWait(driver, 10).until(EC.url_changes(pre_login_url))
+                    except:
+                        print("⚠️ Page URL did not change after login attempt")
                     print("✅ Login completed")
                 else:
                     print("⚠️ Could not find login fields")
@@ -446,17 +660,19 @@ class CompleteAssignmentScraper:
             try:
                 assignments_link = driver.find_element(By.LINK_TEXT, "Assignments")
                 assignments_link.click()
-                time.sleep(3)
+                try:
+                    WebDriverWait(driver, 10).until(EC.staleness_of(assignments_link))
+                except:
+                    # In-page (AJAX) navigation never stales the link
+                    print("⚠️ Page did not reload after clicking 'Assignments'")
                 print("✅ Navigated to Assignments")
             except Exception:
                 print("⚠️ Could not find 'Assignments' link automatically")
-                input("🖱️ Please click on 'Assignments' manually, then press Enter here...")
-            
-            # Wait for content to load
+                if self.interactive:
+                    input("🖱️ Please click on 'Assignments' manually, then press Enter here...")
+
+            # Wait for assignment content to load
             print("⏳ Waiting for assignment content to load...")
-            time.sleep(5)
-            
-            # Try to wait for assignment elements
             try:
                 WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Assignment')]"))
@@ -469,68 +685,63 @@ class CompleteAssignmentScraper:
             print("🔍 Scraping assignment data...")
             
             def normalize_title(title):
-                return re.sub(r'\s+', ' ', title.strip().lower())
-            
-            def is_duplicate_title(title, found_set):
-                normalized = normalize_title(title)
-                for existing in found_set:
-                    existing_normalized = normalize_title(existing)
-                    if normalized == existing_normalized or normalized in existing_normalized or existing_normalized in normalized:
-                        return True
-                return False
-            
+                return _WS_RE.sub(' ', title.strip().lower())
+
+            # Normalized titles already seen: set membership is O(1) per
+            # check, where comparing against every prior title was O(K^2)
+            # over the whole scrape
             assignments_found = set()
-            
+
+            # One DOM snapshot: each element.text / parent lookup through the
+            # WebDriver wire protocol is a separate HTTP round trip, so grab
+            # the page source once and walk it in-process with lxml
+            tree = lxml.html.fromstring(driver.page_source)
+
             # Method 1: Look for assignment elements
-            assignment_elements = driver.find_elements(
-                By.XPATH,
+            assignment_elements = tree.xpath(
                 "//*[contains(text(), 'Assignment') and not(contains(text(), 'Assignments'))]"
             )
-            
+
             print(f"🔍 Found {len(assignment_elements)} potential assignment elements")
-            
+
             for element in assignment_elements:
                 try:
-                    element_text = element.text.strip()
-                    
-                    if (not element_text or len(element_text) < 5 or
-                        any(skip_word in element_text.lower() for skip_word in ['skip', 'click', 'open', 'view', 'navigate'])):
+                    text = _element_text(element)
+
+                    if (not text or len(text) < 5 or
+                        any(skip_word in text.lower() for skip_word in ['skip', 'click', 'open', 'view', 'navigate'])):
                         continue
-                    
+
                     due_date = "No due date found"
                     title = None
-                    
-                    try:
-                        current = element
-                        for level in range(5):
-                            try:
-                                parent_text = current.text.strip()
-                                if parent_text and 'Due:' in parent_text:
-                                    lines = parent_text.split('\n')
-                                    
-                                    for line in lines:
-                                        line = line.strip()
-                                        if 'Assignment' in line and not any(word in line for word in ['Due:', 'Opened:', 'Closed:']):
-                                            if len(line) > 5 and not line.startswith(('Click', 'View', 'Open', 'Navigate', 'Skip')):
-                                                title = line
-                                        elif line.startswith('Due:'):
-                                            due_date = line
-                                    
-                                    if title:
-                                        break
-                                current = current.find_element(By.XPATH, "./parent::*")
-                            except:
+
+                    current = element
+                    for level in range(5):
+                        if current is None:
+                            break
+                        parent_text = _element_text(current)
+                        if parent_text and 'Due:' in parent_text:
+                            for line in parent_text.split('\n'):
+                                line = line.strip()
+                                if 'Assignment' in line and not any(word in line for word in ['Due:', 'Opened:', 'Closed:']):
+                                    if len(line) > 5 and not line.startswith(('Click', 'View', 'Open', 'Navigate', 'Skip')):
+                                        title = line
+                                elif line.startswith('Due:'):
+                                    due_date = line
+
+                            if title:
                                 break
-                    except:
-                        pass
-                    
-                    if title and not is_duplicate_title(title, assignments_found):
-                        assignments_found.add(title)
-                        assignments.append({
-                            'title': title,
-                            'due_date': due_date
-                        })
-                        print(f"📚 Found: {title}")
+                        current = current.getparent()
+
+                    if title:
+                        normalized = normalize_title(title)
+                        if normalized not in assignments_found:
+                            assignments_found.add(normalized)
+                            assignments.append({
+                                'title': title,
+                                'due_date': due_date
+                            })
+                            print(f"📚 Found: {title}")
                         
                 except Exception:
                     continue
@@ -539,12 +750,12 @@ class CompleteAssignmentScraper:
             if len(assignments_found) == 0:
                 print("🔄 Using fallback method...")
                 
-                all_elements = driver.find_elements(By.XPATH, "//*[text()]")
+                all_elements = tree.xpath("//*[text()]")
                 current_assignment = None
                 current_due = None
-                
+
                 for elem in all_elements:
-                    text = elem.text.strip()
+                    text = _element_text(elem)
                     if not text:
                         continue
                         
@@ -554,23 +765,25 @@ class CompleteAssignmentScraper:
                     
                     elif text.startswith('Due:') and current_assignment:
                         current_due = text
-                        
-                        if not is_duplicate_title(current_assignment, assignments_found):
-                            assignments_found.add(current_assignment)
+
+                        normalized = normalize_title(current_assignment)
+                        if normalized not in assignments_found:
+                            assignments_found.add(normalized)
                             assignments.append({
                                 'title': current_assignment,
                                 'due_date': current_due
                             })
                             print(f"📚 Found: {current_assignment}")
-                        
+
                         current_assignment = None
                         current_due = None
             
             print(f"✅ Scraping completed! Found {len(assignments)} assignments")
-            input("🖱️ Press Enter to close browser and continue...")
+            if self.interactive:
+                input("🖱️ Press Enter to close browser and continue...")
             
         finally:
-            driver.quit()
+            release_driver(driver)
         
         return assignments
     
@@ -682,7 +895,7 @@ class CompleteAssignmentScraper:
 
 if __name__ == "__main__":
     try:
-        scraper = CompleteAssignmentScraper()
+        scraper = CompleteAssignmentScraper(interactive=True)
         scraper.run()
     except KeyboardInterrupt:
         print("\n\n👋 Assignment Agent stopped by user")